@@ -3,24 +3,36 @@ Audio transcription module using faster-whisper with loguru logging
 """
 
 import os
+import queue
 import sys
+import threading
 import time
-from pathlib import Path
+from functools import lru_cache
 
+import ctranslate2
 import psutil
-from faster_whisper import WhisperModel
+from faster_whisper import BatchedInferencePipeline, WhisperModel
 from loguru import logger
 from tqdm import tqdm
 
+import worker
+
 # Default configuration
 DEFAULT_CONFIG = {
     "model_size": "base",
-    "device": "cpu",
-    "compute_type": "int8",
-    "beam_size": 5,
+    "device": None,  # None auto-detects CUDA, falling back to CPU
+    "compute_type": None,  # None picks the best type for the detected device
+    "beam_size": 1,  # Greedy decoding; pass a larger value to opt in to beam search
+    "batch_size": 1,  # 30-s windows per encoder pass; >1 batches, 0 picks by device
     "language": "ru",
+    "vad_filter": True,  # Skip silent regions with Silero VAD before decoding
+    "vad_min_silence_ms": 500,  # Minimum silence duration treated as a gap
+    "condition_on_previous_text": False,  # Feed prior text back into the decoder
+    "initial_prompt": None,  # Optional text to prime the first window
+    "without_timestamps": False,  # Skip timestamp tokens; segments become whole windows
     "log_level": "INFO",
     "console_format": "<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | {message}",
+    "log_segments": True,  # Log a segment preview to stderr every N segments
     "segment_log_interval": 10,  # Log every N segments
     "memory_log_interval": 100,  # Log memory usage every N segments
     "line_break_interval": 5,  # Add line break after N sentences
@@ -29,29 +41,126 @@ DEFAULT_CONFIG = {
     "print_transcript": False,  # Whether to print transcript to console
 }
 
+WRITE_BUFFER_SIZE = 1 << 16  # Output file buffer size in bytes
+WRITE_BATCH_SEGMENTS = 32  # Flush queued segment text every N segments
+WRITE_QUEUE_SIZE = 64  # Maximum segments waiting for the writer thread
+
+# CPU inference threads: one per physical core, hyperthreads only add contention
+CPU_THREADS = worker.physical_cores()
+
+
+# Colored logger proxy, created once instead of on every call
+_clog = logger.opt(colors=True)
+
+# Dedicated level for per-segment progress so sinks can route on level number
+SEGMENT_LEVEL = logger.level("SEGMENT", no=15, color="<dim>")
+
 
 # Set up console-only logger
 def setup_logger(config):
     """Set up the logger with the provided configuration"""
+    segment_no = SEGMENT_LEVEL.no
     logger.remove()
     logger.add(
         sys.stdout,
         level=config["log_level"],
         format=config["console_format"],
         colorize=True,
-        filter=lambda record: "Segment"
-        not in record["message"],  # Filter out segment logs
+        filter=lambda record: record["level"].no != segment_no,  # No segment logs
     )
     # Add separate logger for segment details
-    logger.add(
-        sys.stderr,
-        level="DEBUG",
-        format="<dim>{time:HH:mm:ss}</dim> | <level>{level: <8}</level> | {message}",
-        colorize=True,
-        filter=lambda record: "Segment" in record["message"],  # Only segment logs
+    if config["log_segments"]:
+        logger.add(
+            sys.stderr,
+            level=segment_no,
+            format="<dim>{time:HH:mm:ss}</dim> | <level>{level: <8}</level> | {message}",
+            colorize=True,
+            filter=lambda record: record["level"].no == segment_no,  # Only segment logs
+        )
+
+
+def _segment_writer(md_file, segment_queue, errors):
+    """Write (text, needs_break) items from the queue to md_file until None arrives
+
+    A write error is appended to errors and the rest of the queue is drained,
+    so the producer sees the error instead of blocking on a full queue.
+    """
+    pending = []
+    item = ()
+    try:
+        while item is not None:
+            item = segment_queue.get()
+            if item is not None:
+                segment_text, needs_break = item
+                pending.append(f" {segment_text}\n")
+                if needs_break:
+                    pending.append("\n")
+            if len(pending) >= WRITE_BATCH_SEGMENTS or item is None:
+                md_file.writelines(pending)
+                pending.clear()
+    except Exception as e:
+        errors.append(e)
+        while item is not None:
+            item = segment_queue.get()
+
+
+def _autodetect_device():
+    """Return (device, compute_type) for the fastest hardware available"""
+    device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    return device, worker.resolve_compute_type(device, "auto")
+
+
+@lru_cache(maxsize=4)
+def _load_model(model_size, device, compute_type, cpu_threads):
+    """Load a WhisperModel; results are cached per argument combination"""
+    # Same on-disk cache as the TUI, read without a network round trip when present
+    return worker.open_whisper_model(
+        WhisperModel,
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=1,
     )
 
 
+# One lock per model key, so a prewarm and a real call never load the same
+# weights twice while loads of different models do not wait on each other
+_model_locks = {}
+_model_locks_guard = threading.Lock()
+
+
+def _get_model(model_size, device, compute_type, cpu_threads):
+    """Return a shared WhisperModel so repeated calls skip reloading weights"""
+    key = (model_size, device, compute_type, cpu_threads)
+    with _model_locks_guard:
+        lock = _model_locks.setdefault(key, threading.Lock())
+    with lock:
+        return _load_model(*key)
+
+
+def _prewarm_default_model():
+    """Load the default model so the first transcription finds it ready"""
+    try:
+        device, compute_type = _autodetect_device()
+        _get_model(
+            DEFAULT_CONFIG["model_size"],
+            DEFAULT_CONFIG["device"] or device,
+            DEFAULT_CONFIG["compute_type"] or compute_type,
+            CPU_THREADS,
+        )
+    except Exception as e:
+        # The real call retries the load and reports the error itself
+        _clog.warning(f"Model prewarm failed: <yellow>{e}</yellow>")
+
+
+# Opt-in: start loading the default model in the background at import time.
+# Not when run as a script: it loads the requested model straight away, and a
+# prewarm of another model would only compete with it and stay in the cache.
+if os.environ.get("OFFLINESTT_PREWARM") == "1" and __name__ != "__main__":
+    threading.Thread(target=_prewarm_default_model, daemon=True).start()
+
+
 def transcribe_audio(
     audio_path,
     output_path=None,
@@ -94,8 +203,7 @@ def transcribe_audio(
 
     # Set default output path if not provided
     if output_path is None:
-        audio_file = Path(audio_path)
-        output_path = str(audio_file.with_suffix(".md"))
+        output_path = os.path.splitext(audio_path)[0] + ".md"
 
     # Create output directory if it doesn't exist
     output_dir = os.path.dirname(output_path)
@@ -105,62 +213,122 @@ def transcribe_audio(
     # Setup logger with current config
     setup_logger(config)
 
+    # Fill in device and compute type from the hardware when not overridden
+    if device is None:
+        device, detected_compute_type = _autodetect_device()
+        compute_type = compute_type or detected_compute_type
+        _clog.info(
+            f"Auto-selected device <yellow>{device}</yellow> "
+            f"with compute type <cyan>{compute_type}</cyan>"
+        )
+    elif compute_type is None:
+        compute_type = "auto"
+
     # Start timing the transcription process
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # Initialize the model
-    logger.opt(colors=True).info(
-        f"Initializing <green>Whisper</green> model: <cyan>{model_size}</cyan>"
-    )
-    model = WhisperModel(model_size, device=device, compute_type=compute_type)
+    _clog.info(f"Initializing <green>Whisper</green> model: <cyan>{model_size}</cyan>")
+    model = _get_model(model_size, device, compute_type, CPU_THREADS)
+    _clog.info(f"Resolved compute type: <cyan>{model.model.compute_type}</cyan>")
 
     # Log audio file info
-    audio_file = Path(audio_path)
-    if audio_file.exists():
-        file_size = audio_file.stat().st_size / (1024 * 1024)  # Size in MB
-    if audio_file.exists():
-        file_size = audio_file.stat().st_size / (1024 * 1024)  # Size in MB
-        logger.opt(colors=True).info(
-            f"Audio file: <blue>{audio_file.name}</blue> ({file_size:.2f} MB)"
-        )
-    else:
-        logger.opt(colors=True).error(f"Audio file <red>not found</red>: {audio_path}")
-        raise FileNotFoundError(f"Audio file not found: {audio_path}")
-
-    logger.opt(colors=True).info(f"Output will be saved to: <blue>{output_path}</blue>")
-    logger.opt(colors=True).info(
+    audio_name = os.path.basename(audio_path)
+    try:
+        audio_stat = os.stat(audio_path)
+    except FileNotFoundError:
+        _clog.error(f"Audio file <red>not found</red>: {audio_path}")
+        raise FileNotFoundError(f"Audio file not found: {audio_path}") from None
+    file_size = audio_stat.st_size / (1024 * 1024)  # Size in MB
+    _clog.info(f"Audio file: <blue>{audio_name}</blue> ({file_size:.2f} MB)")
+
+    _clog.info(f"Output will be saved to: <blue>{output_path}</blue>")
+    _clog.info(
         f"Model: <cyan>{model_size}</cyan> ({compute_type}) on <yellow>{device}</yellow>"
     )
 
-    # Create output file and write header
-    logger.opt(colors=True).info("<green>Creating</green> output file...")
-    with open(output_path, "w") as md_file:
-        md_file.write("# Transcription Results\n\n")
-        md_file.write(f"## Audio File: {audio_file.name}\n\n")
-        md_file.write(f"## Model: {model_size}\n\n")
-        md_file.write(f"## Language: {language}\n\n")
-        md_file.write("## Transcription:\n\n")
+    # Greedy decoding takes a single sample with no temperature fallback
+    decode_options = {
+        "beam_size": beam_size,
+        "condition_on_previous_text": config["condition_on_previous_text"],
+        "initial_prompt": config["initial_prompt"],
+        "without_timestamps": config["without_timestamps"],
+        "vad_filter": config["vad_filter"],
+    }
+    if config["vad_filter"]:
+        decode_options["vad_parameters"] = {
+            "min_silence_duration_ms": config["vad_min_silence_ms"]
+        }
+    if beam_size == 1:
+        decode_options.update(best_of=1, temperature=[0.0])
+        _clog.info("Decoding: <cyan>greedy decoding</cyan>")
+    else:
+        _clog.info(f"Decoding: <cyan>beam search (k={beam_size})</cyan>")
+    if config["condition_on_previous_text"]:
+        _clog.info("Previous-text context: <yellow>enabled</yellow>")
+    else:
+        _clog.info("Previous-text context: <cyan>disabled</cyan>")
+
+    # Batch several 30-s windows per encoder pass when requested; the batched
+    # pipeline builds its windows from VAD speech chunks, so it needs VAD on
+    batch_size = config["batch_size"] or worker.auto_batch_size(device)
+    if batch_size > 1 and not config["vad_filter"]:
+        _clog.info("Batched inference: <yellow>off</yellow> (needs VAD)")
+        batch_size = 1
+    if batch_size > 1:
+        _clog.info(f"Batched inference: <cyan>{batch_size}</cyan> windows")
+        transcriber = BatchedInferencePipeline(model=model)
+        decode_options["batch_size"] = batch_size
+    else:
+        transcriber = model
 
     # Start transcription
-    logger.opt(colors=True).info("<green>Starting</green> transcription process...")
+    _clog.info("<green>Starting</green> transcription process...")
     try:
-        segments, info = model.transcribe(
-            audio_path, beam_size=beam_size, language=language
+        segments, info = transcriber.transcribe(
+            audio_path, language=language, **decode_options
         )
     except Exception as e:
-        logger.opt(colors=True).error(f"Error during transcription: <red>{e}</red>")
+        _clog.error(f"Error during transcription: <red>{e}</red>")
         raise
 
     # Log audio detection info
-    logger.opt(colors=True).info(
+    _clog.info(
         f"Detected language: <green>{info.language}</green> (confidence: {info.language_probability:.2f})"
     )
 
-    # Process and save each segment on the fly with progress bar
-    with open(output_path, "a") as md_file:
+    # Create output file, write header, then stream segments through the same handle
+    _clog.info("<green>Creating</green> output file...")
+    with open(output_path, "w", buffering=WRITE_BUFFER_SIZE) as md_file:
+        md_file.write(
+            "".join(
+                [
+                    "# Transcription Results\n\n",
+                    f"## Audio File: {audio_name}\n\n",
+                    f"## Model: {model_size}\n\n",
+                    f"## Language: {language}\n\n",
+                    "## Transcription:\n\n",
+                ]
+            )
+        )
+
         segment_count = 0
         total_chars = 0
 
+        # Hoist config lookups out of the per-segment loop
+        segment_log_interval = config["segment_log_interval"]
+        memory_log_interval = config["memory_log_interval"]
+        line_break_interval = config["line_break_interval"]
+        max_preview_chars = config["max_preview_chars"]
+        preview_slice = slice(0, max_preview_chars)
+        show_progress = config["show_progress"]
+        echo_transcript = config["print_transcript"] and not show_progress
+        log_memory = config["log_level"] == "DEBUG"
+        # Skip building segment log lines entirely when their sink is off
+        log_segments = config["log_segments"]
+        # Remainder that selects the 1st, (N+1)th, ... segment for logging
+        log_remainder = 1 % segment_log_interval
+
         # Use a cleaner tqdm configuration
         progress_args = {
             "desc": "Transcribing",
@@ -171,71 +339,99 @@ def transcribe_audio(
             "bar_format": "{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}{postfix}]",
         }
 
+        # Hand file writes to a background thread so decoding is not held up by I/O
+        segment_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        writer_errors = []
+        writer = threading.Thread(
+            target=_segment_writer,
+            args=(md_file, segment_queue, writer_errors),
+            daemon=True,
+        )
+        writer.start()
+
         with (
             tqdm(**progress_args)
-            if config["show_progress"]
+            if show_progress
             else tqdm(total=0, disable=True) as pbar
         ):
-            for i, segment in enumerate(segments):
-                segment_count += 1
-                segment_text = segment.text.strip()
-                segment_chars = len(segment_text)
-                total_chars += segment_chars
-
-                # Calculate transcription speed (characters per second)
-                elapsed_time = time.time() - start_time
-                char_rate = total_chars / elapsed_time if elapsed_time > 0 else 0
-
-                # Log every N segments
-                if i % config["segment_log_interval"] == 0:
-                    preview = segment_text[: config["max_preview_chars"]]
-                    if len(segment_text) > config["max_preview_chars"]:
-                        preview += "..."
-                    logger.opt(colors=True).info(
-                        f"Segment <blue>{segment_count}</blue>: '<yellow>{preview}</yellow>' | Speed: {char_rate:.1f} chars/sec"
-                    )
-
-                # Print to console for immediate feedback (optional)
-                if config["print_transcript"] and not config["show_progress"]:
-                    print(f"({segment_count:03d}) {segment_text}")
-
-                # Write to markdown file immediately
-                md_file.write(f" {segment_text}\n")
-
-                # Add a line break in markdown for readability
-                if (
-                    i % config["line_break_interval"]
-                    == config["line_break_interval"] - 1
-                ):
-                    md_file.write("\n")
-
-                # Update progress bar
-                if config["show_progress"]:
-                    pbar.update(1)
-                    pbar.set_postfix(
-                        {"speed": f"{char_rate:.1f} c/s", "seg": segment_count}
-                    )
-
-                # Memory awareness: log every N segments
-                if segment_count % config["memory_log_interval"] == 0:
-                    memory_usage = psutil.virtual_memory().used / (
-                        1024 * 1024 * 1024
-                    )  # GB
-                    logger.opt(colors=True).info(
-                        f"Memory: <magenta>{memory_usage:.2f} GB</magenta> | Segments: <blue>{segment_count}</blue>"
+            try:
+                for segment_count, segment in enumerate(segments, 1):
+                    segment_text = segment.text.strip()
+                    total_chars += len(segment_text)
+
+                    # Log every N segments, sampling the clock only when needed
+                    if segment_count % segment_log_interval == log_remainder:
+                        elapsed_time = time.perf_counter() - start_time
+                        char_rate = (
+                            total_chars / elapsed_time if elapsed_time > 0 else 0
+                        )
+                        if log_segments:
+                            preview = segment_text[preview_slice]
+                            if len(segment_text) > max_preview_chars:
+                                preview += "..."
+                            logger.log(
+                                "SEGMENT",
+                                f"Segment {segment_count}: '{preview}' | Speed: {char_rate:.1f} chars/sec",
+                            )
+
+                    # Print to console for immediate feedback (optional)
+                    if echo_transcript:
+                        tqdm.write(f"({segment_count:03d}) {segment_text}")
+
+                    # Queue the segment, adding a line break for readability
+                    segment_queue.put(
+                        (segment_text, segment_count % line_break_interval == 0)
                     )
+                    if writer_errors:
+                        break
+
+                    # Update progress bar once per log interval to limit redraws
+                    if show_progress and segment_count % segment_log_interval == 0:
+                        elapsed_time = time.perf_counter() - start_time
+                        char_rate = (
+                            total_chars / elapsed_time if elapsed_time > 0 else 0
+                        )
+                        # Set the postfix first so the update's redraw shows it
+                        pbar.set_postfix_str(
+                            f"{char_rate:5.1f} c/s | seg {segment_count}",
+                            refresh=False,
+                        )
+                        pbar.update(segment_count - pbar.n)
+
+                    # Memory awareness: log every N segments at debug level
+                    if log_memory and segment_count % memory_log_interval == 0:
+                        memory_usage = psutil.virtual_memory().used / (
+                            1024 * 1024 * 1024
+                        )  # GB
+                        _clog.debug(
+                            f"Memory: <magenta>{memory_usage:.2f} GB</magenta> | Segments: <blue>{segment_count}</blue>"
+                        )
+            finally:
+                segment_queue.put(None)
+                writer.join()
+            if writer_errors:
+                _clog.error(f"Error writing output file: <red>{writer_errors[0]}</red>")
+                raise writer_errors[0]
+
+            if show_progress:
+                elapsed_time = time.perf_counter() - start_time
+                char_rate = total_chars / elapsed_time if elapsed_time > 0 else 0
+                pbar.set_postfix_str(
+                    f"{char_rate:5.1f} c/s | seg {segment_count}", refresh=False
+                )
+                pbar.update(segment_count - pbar.n)
 
     # Calculate and log final statistics
-    elapsed_time = time.time() - start_time
-    logger.opt(colors=True).info("<green>✅ Transcription completed!</green>")
-    logger.opt(colors=True).info(
+    elapsed_time = time.perf_counter() - start_time
+    _clog.info("<green>✅ Transcription completed!</green>")
+    _clog.info(
         f"Processed <blue>{segment_count}</blue> segments with <yellow>{total_chars}</yellow> total characters"
     )
-    logger.opt(colors=True).info(f"Total time: <cyan>{elapsed_time:.2f}</cyan> seconds")
-    logger.opt(colors=True).info(
+    _clog.info(f"Total time: <cyan>{elapsed_time:.2f}</cyan> seconds")
+    _clog.info(
         f"Average speed: <cyan>{total_chars / elapsed_time:.1f}</cyan> characters per second"
     )
-    logger.opt(colors=True).info(f"Results saved to: <blue>{output_path}</blue>")
+    _clog.info(f"Results saved to: <blue>{output_path}</blue>")
 
     # Print final message
     if config["show_progress"]:
@@ -244,12 +440,46 @@ def transcribe_audio(
     return output_path
 
 
-# Running this script directly will use command line arguments or defaults
-if __name__ == "__main__":
+def transcribe_audio_batch(paths, **kwargs):
+    """
+    Transcribe several audio files, reusing one loaded model for all of them
+
+    Args:
+        paths (iterable): Audio paths, or (audio_path, output_path) pairs.
+            An output_path of None uses the default next to the audio file.
+        **kwargs: Arguments forwarded to transcribe_audio for every file
+
+    Returns:
+        list: Paths to the output files, in input order
+    """
+    output_paths = []
+    for item in paths:
+        if isinstance(item, (tuple, list)):
+            audio_path, output_path = item
+        else:
+            audio_path, output_path = item, None
+        output_paths.append(
+            transcribe_audio(audio_path, output_path=output_path, **kwargs)
+        )
+    return output_paths
+
+
+def _read_batch_lines(stream):
+    """Parse 'audio_path<TAB>output_path' lines; the output column is optional"""
+    for line in stream:
+        line = line.rstrip("\n")
+        if not line.strip():
+            continue
+        audio_path, _, output_path = line.partition("\t")
+        yield audio_path, output_path or None
+
+
+def main():
+    """Transcribe from command line arguments or defaults"""
     import argparse
 
     parser = argparse.ArgumentParser(description="Transcribe audio file to text")
-    parser.add_argument("audio_path", help="Path to the audio file")
+    parser.add_argument("audio_path", nargs="?", help="Path to the audio file")
     parser.add_argument("-o", "--output", help="Output file path")
     parser.add_argument(
         "-m",
@@ -274,19 +504,57 @@ if __name__ == "__main__":
         "-d",
         "--device",
         default=DEFAULT_CONFIG["device"],
-        help=f"Device to run model on (default: {DEFAULT_CONFIG['device']})",
+        help="Device to run model on (default: cuda if available, else cpu)",
     )
     parser.add_argument(
         "-c",
         "--compute_type",
         default=DEFAULT_CONFIG["compute_type"],
-        help=f"Computation type (default: {DEFAULT_CONFIG['compute_type']})",
+        help="Computation type (default: int8_float16 on cuda, auto on cpu)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_CONFIG["batch_size"],
+        help=f"Audio windows encoded per pass (default: {DEFAULT_CONFIG['batch_size']}); "
+        "GPUs and many-core CPUs benefit from 4-16, 0 picks a size for the device; "
+        "ignored with --no-vad",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="-",
+        help="Read 'audio_path<TAB>output_path' lines from stdin ('-') and "
+        "transcribe them all with a single loaded model",
+    )
+    parser.add_argument(
+        "--condition-on-previous",
+        action="store_true",
+        help="Condition each window on the previously decoded text (slower)",
+    )
+    parser.add_argument(
+        "--initial-prompt",
+        help="Text used to prime the decoder for the first window",
+    )
+    parser.add_argument(
+        "--without-timestamps",
+        action="store_true",
+        help="Do not decode timestamp tokens (fewer decoder steps, longer segments)",
+    )
+    parser.add_argument(
+        "--no-vad",
+        action="store_true",
+        help="Disable voice activity detection (transcribe silent regions too)",
     )
     parser.add_argument(
         "--no-progress",
         action="store_true",
         help="Disable progress bar",
     )
+    parser.add_argument(
+        "--no-segment-log",
+        action="store_true",
+        help="Do not log segment previews to stderr",
+    )
     parser.add_argument(
         "--print-transcript",
         action="store_true",
@@ -294,20 +562,42 @@ if __name__ == "__main__":
     )
 
     args = parser.parse_args()
+    if args.batch is None and args.audio_path is None:
+        parser.error("audio_path is required unless --batch is given")
+    if args.batch is not None and args.batch != "-":
+        parser.error("--batch only supports reading from stdin ('-')")
 
     # Set up logging options based on command line arguments
     kwargs = {
         "show_progress": not args.no_progress,
         "print_transcript": args.print_transcript or args.no_progress,
+        "log_segments": not args.no_segment_log,
+        "vad_filter": not args.no_vad,
+        "batch_size": args.batch_size,
+        "condition_on_previous_text": args.condition_on_previous,
+        "initial_prompt": args.initial_prompt,
+        "without_timestamps": args.without_timestamps,
     }
 
-    transcribe_audio(
-        audio_path=args.audio_path,
-        output_path=args.output,
-        model_size=args.model,
-        language=args.language,
-        beam_size=args.beam_size,
-        device=args.device,
-        compute_type=args.compute_type,
-        **kwargs,
-    )
+    model_args = {
+        "model_size": args.model,
+        "language": args.language,
+        "beam_size": args.beam_size,
+        "device": args.device,
+        "compute_type": args.compute_type,
+    }
+
+    if args.batch:
+        transcribe_audio_batch(_read_batch_lines(sys.stdin), **model_args, **kwargs)
+    else:
+        transcribe_audio(
+            audio_path=args.audio_path,
+            output_path=args.output,
+            **model_args,
+            **kwargs,
+        )
+
+
+# Running this script directly will use command line arguments or defaults
+if __name__ == "__main__":
+    main()
@@ -2,22 +2,26 @@
 """TUI for recording and transcribing audio using Textual with animations."""
 
 import asyncio
+import functools
 import gc
+import heapq
+import io
+import itertools
 import json
+import math
 import os
 import signal
 import subprocess
-import tempfile
+import sys
 import time
 from datetime import datetime
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
-from typing import Any
+from dataclasses import dataclass, asdict
 
 from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
-from textual.containers import Container, Horizontal, Vertical, VerticalScroll
+from textual.containers import Container, Horizontal, VerticalScroll
 from textual.css.query import NoMatches
 from textual.message import Message
 from textual.reactive import reactive
@@ -33,12 +37,86 @@ from textual.widgets import (
     RichLog,
     Select,
     Static,
+    Switch,
 )
+from textual.worker import get_current_worker
+
+import worker
 
 
 CONFIG_DIR = Path.home() / ".config" / "offlinestt"
 CONFIG_FILE = CONFIG_DIR / "offlinestt.json"
 
+AUDIO_SUFFIXES = frozenset({".wav", ".mp3", ".m4a", ".flac", ".ogg"})
+
+# Quality select options as (label, beam size); 0 picks the beam per run
+QUALITY_OPTIONS = [("Auto", 0), ("Fast (greedy)", 1), ("Balanced", 3), ("Accurate", 5)]
+
+# Small models decode silence cheaply, so VAD starts off for them
+VAD_DEFAULT_OFF = frozenset({"tiny", "small"})
+
+# Returned by next() once the segment generator is exhausted
+_END_OF_SEGMENTS = object()
+
+WRITE_BATCH_SEGMENTS = 32  # Segments buffered per write to the transcript
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """os.write until all of data is written."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _import_faster_whisper():
+    """Import faster_whisper, or return None if it is not installed."""
+    # OpenMP/MKL read these once, when ctranslate2 is loaded
+    threads = str(worker.physical_cores())
+    os.environ.setdefault("OMP_NUM_THREADS", threads)
+    os.environ.setdefault("MKL_NUM_THREADS", threads)
+    try:
+        import faster_whisper
+    except ImportError:
+        return None
+    return faster_whisper
+
+
+def _initial_beam_size(saved: int) -> int:
+    """BEAM_SIZE from the environment, else the saved setting, else auto.
+
+    Values that are not a Quality option are skipped; Select rejects them.
+    """
+    valid = {beam_size for _, beam_size in QUALITY_OPTIONS}
+    for value in (os.environ.get("BEAM_SIZE"), saved):
+        try:
+            if int(value) in valid:
+                return int(value)
+        except (TypeError, ValueError):
+            pass
+    return 0
+
+
+def _next_worker_segment(conn):
+    """Receive the worker's next segment, or the sentinel once it is done."""
+    kind, payload = worker.recv(conn)
+    return payload if kind == "segment" else _END_OF_SEGMENTS
+
+
+def _list_audio(dirpath: Path) -> list[os.DirEntry]:
+    """List audio files in a directory with a single scandir pass."""
+    try:
+        it = os.scandir(dirpath)
+    except OSError:
+        # Missing or unreadable directory: nothing to list, as Path.glob did
+        return []
+    with it:
+        return [
+            entry
+            for entry in it
+            if entry.is_file()
+            and os.path.splitext(entry.name)[1].lower() in AUDIO_SUFFIXES
+        ]
+
 
 @dataclass
 class Settings:
@@ -49,6 +127,9 @@ class Settings:
     model_size: str = "medium"
     language: str = "ru"
     device: str = "cpu"
+    compute_type: str = "auto"
+    beam_size: int = 0  # 0 = auto, see RecordTranscribeTUI.run_transcription
+    prefer_distil: bool = False
     theme: str = "textual-dark"
     max_seconds: int = 3000
 
@@ -90,6 +171,45 @@ class Settings:
         self.save()
 
 
+class AnimationClock(Static):
+    """A single shared ticker that drives every animated widget."""
+
+    DEFAULT_CSS = """
+    AnimationClock {
+        display: none;
+    }
+    """
+
+    INTERVAL = 0.05
+
+    tick_count = reactive(0)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._anim_timer = None
+        self._users = 0
+
+    def on_mount(self) -> None:
+        self._anim_timer = self.set_interval(self.INTERVAL, self._tick, pause=True)
+
+    def _tick(self) -> None:
+        # Nothing is worth redrawing while the app is in the background
+        if self.app.app_focus:
+            self.tick_count += 1
+
+    def acquire(self) -> None:
+        """Register an active animation, starting the ticker if needed."""
+        self._users += 1
+        if self._users == 1 and self._anim_timer:
+            self._anim_timer.resume()
+
+    def release(self) -> None:
+        """Unregister an animation, pausing the ticker once none remain."""
+        self._users = max(0, self._users - 1)
+        if self._users == 0 and self._anim_timer:
+            self._anim_timer.pause()
+
+
 class PulsingDot(Static):
     """An animated pulsing dot indicator."""
 
@@ -112,37 +232,43 @@ class PulsingDot(Static):
         " \u25cb ",
         " \u25cf ",
     ]
+    # Markup for every frame, rendered once instead of on each tick
+    _RENDERED_CYAN = tuple(f"[bold cyan]{f}[/]" for f in FRAMES)
+    _RENDERED_RED = tuple(f"[bold red]{f}[/]" for f in RECORDING_FRAMES)
+
+    STRIDE = 3  # Clock ticks per frame (0.15s)
 
     def __init__(self, recording_mode: bool = False, **kwargs):
         super().__init__(**kwargs)
         self.recording_mode = recording_mode
-        self._anim_timer = None
+        self._clock = None
 
     def on_mount(self) -> None:
-        self._anim_timer = self.set_interval(0.15, self._tick, pause=True)
+        self._clock = self.app.query_one(AnimationClock)
+        self.watch(self._clock, "tick_count", self._on_tick, init=False)
 
-    def _tick(self) -> None:
-        if self.active:
+    def _on_tick(self, tick_count: int) -> None:
+        # An empty region means the widget is hidden or not laid out yet
+        if self.active and tick_count % self.STRIDE == 0 and self.region.width:
             self.frame = (self.frame + 1) % len(self.FRAMES)
 
     def watch_frame(self, frame: int) -> None:
-        frames = self.RECORDING_FRAMES if self.recording_mode else self.FRAMES
         self.update(
-            f"[bold red]{frames[frame]}[/]"
+            self._RENDERED_RED[frame]
             if self.recording_mode
-            else f"[bold cyan]{frames[frame]}[/]"
+            else self._RENDERED_CYAN[frame]
         )
 
     def start(self) -> None:
+        if not self.active and self._clock:
+            self._clock.acquire()
         self.active = True
         self.frame = 0
-        if self._anim_timer:
-            self._anim_timer.resume()
 
     def stop(self) -> None:
+        if self.active and self._clock:
+            self._clock.release()
         self.active = False
-        if self._anim_timer:
-            self._anim_timer.pause()
         self.update("   ")
 
 
@@ -157,7 +283,6 @@ class SpinnerWidget(Static):
     """
 
     active = reactive(False)
-    frame = reactive(0)
 
     FRAMES = [
         "\u280b",
@@ -171,31 +296,35 @@ class SpinnerWidget(Static):
         "\u2807",
         "\u280f",
     ]
+    _RENDERED = tuple(f"[bold cyan]{f}[/]" for f in FRAMES)
+
+    STRIDE = 2  # Clock ticks per frame (0.1s)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._anim_timer = None
+        self._clock = None
+        self._frames = itertools.cycle(self._RENDERED)
 
     def on_mount(self) -> None:
-        self._anim_timer = self.set_interval(0.08, self._tick, pause=True)
+        self._clock = self.app.query_one(AnimationClock)
+        self.watch(self._clock, "tick_count", self._on_tick, init=False)
 
-    def _tick(self) -> None:
-        if self.active:
-            self.frame = (self.frame + 1) % len(self.FRAMES)
-
-    def watch_frame(self, frame: int) -> None:
-        self.update(f"[bold cyan]{self.FRAMES[frame]}[/]")
+    def _on_tick(self, tick_count: int) -> None:
+        # An empty region means the widget is hidden or not laid out yet
+        if self.active and tick_count % self.STRIDE == 0 and self.region.width:
+            self.update(next(self._frames))
 
     def start(self) -> None:
+        if not self.active and self._clock:
+            self._clock.acquire()
         self.active = True
-        self.frame = 0
-        if self._anim_timer:
-            self._anim_timer.resume()
+        self._frames = itertools.cycle(self._RENDERED)
+        self.update(next(self._frames))
 
     def stop(self) -> None:
+        if self.active and self._clock:
+            self._clock.release()
         self.active = False
-        if self._anim_timer:
-            self._anim_timer.pause()
         self.update(" ")
 
 
@@ -222,49 +351,67 @@ class WaveformWidget(Static):
         "\u2587",
         "\u2588",
     ]
+    _BAR_CACHE = tuple(f"[bold red]{b}[/]" for b in BARS)
     NUM_BARS = 20
+    STRIDE = 1  # Clock ticks per frame (0.05s)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._anim_timer = None
-        self._pattern = [0] * self.NUM_BARS
+        self._clock = None
+        # Ring buffer of levels; _head is the oldest entry and next write slot
+        self._pattern = bytearray(self.NUM_BARS)
+        self._head = 0
         self._audio_stream = None
-        self._current_level = 0.0
+        self._current_level = 0
+        self._dot = None
 
     def on_mount(self) -> None:
-        self._anim_timer = self.set_interval(0.05, self._tick, pause=True)
+        self._clock = self.app.query_one(AnimationClock)
+        self.watch(self._clock, "tick_count", self._on_tick, init=False)
 
     def _audio_callback(self, indata, frames, time_info, status) -> None:
         """Callback for sounddevice to capture audio levels."""
-        import numpy as np
-
-        # Calculate RMS level
-        rms = np.sqrt(np.mean(indata**2))
+        # Calculate RMS level in one pass (dot product avoids a squared temporary)
+        samples = indata[:, 0]
+        rms = math.sqrt(float(self._dot(samples, samples)) / samples.size)
         # Convert to a 0-7 scale (log scale for better visualization)
+        # Scalar math stays in the math module; numpy ufuncs on scalars are slow
         if rms > 0:
             # Use log scale, typical speech is around -20 to -10 dB
-            db = 20 * np.log10(rms + 1e-10)
+            db = 20 * math.log10(rms + 1e-10)
             # Map -60dB to 0dB range to 0-7
-            level = int(np.clip((db + 60) / 60 * 8, 0, 7))
+            level = int(min(max((db + 60) / 60 * 8, 0), 7))
         else:
             level = 0
         self._current_level = level
 
-    def _tick(self) -> None:
-        if self.active:
-            # Shift pattern left and add current audio level
-            self._pattern = self._pattern[1:] + [self._current_level]
+    def _on_tick(self, tick_count: int) -> None:
+        # An empty region means the widget is hidden or not laid out yet
+        if self.active and tick_count % self.STRIDE == 0 and self.region.width:
+            # Overwrite the oldest level with the current one
+            self._pattern[self._head] = self._current_level
+            self._head = (self._head + 1) % self.NUM_BARS
             self._update_display()
 
     def _update_display(self) -> None:
-        bars = "".join(f"[bold red]{self.BARS[v]}[/]" for v in self._pattern)
+        head = self._head
+        cache = self._BAR_CACHE
+        bars = "".join([cache[v] for v in self._pattern[head:]])
+        bars += "".join([cache[v] for v in self._pattern[:head]])
         self.update(bars)
 
     def start(self) -> None:
+        import numpy as np
         import sounddevice as sd
 
+        # Bound once here rather than imported on every audio block
+        self._dot = np.dot
+
+        if not self.active and self._clock:
+            self._clock.acquire()
         self.active = True
-        self._pattern = [0] * self.NUM_BARS
+        self._pattern = bytearray(self.NUM_BARS)
+        self._head = 0
         self._current_level = 0
 
         # Start audio input stream for level monitoring
@@ -280,13 +427,10 @@ class WaveformWidget(Static):
             # Fallback: if audio capture fails, we'll just show zeros
             pass
 
-        if self._anim_timer:
-            self._anim_timer.resume()
-
     def stop(self) -> None:
+        if self.active and self._clock:
+            self._clock.release()
         self.active = False
-        if self._anim_timer:
-            self._anim_timer.pause()
 
         # Stop audio stream
         if self._audio_stream:
@@ -297,7 +441,8 @@ class WaveformWidget(Static):
                 pass
             self._audio_stream = None
 
-        self._pattern = [0] * self.NUM_BARS
+        self._pattern = bytearray(self.NUM_BARS)
+        self._head = 0
         self.update("[dim]" + "\u2581" * self.NUM_BARS + "[/]")
 
 
@@ -328,15 +473,20 @@ class Timer(Static):
         self.running = False
         self.update_timer.pause()
 
+    _last_render = ""
+
     def watch_elapsed(self, elapsed: int) -> None:
-        minutes, seconds = divmod(elapsed, 60)
-        hours, minutes = divmod(minutes, 60)
+        hours, rem = divmod(elapsed, 3600)
+        minutes, seconds = divmod(rem, 60)
         if self.running:
             # Blinking colon effect
-            sep = ":" if elapsed % 2 == 0 else " "
-            self.update(f"[bold]{hours:02d}{sep}{minutes:02d}{sep}{seconds:02d}[/]")
+            sep = " " if elapsed & 1 else ":"
+            text = f"[bold]{hours:02d}{sep}{minutes:02d}{sep}{seconds:02d}[/]"
         else:
-            self.update(f"[dim]{hours:02d}:{minutes:02d}:{seconds:02d}[/]")
+            text = f"[dim]{hours:02d}:{minutes:02d}:{seconds:02d}[/]"
+        if text != self._last_render:
+            self._last_render = text
+            self.update(text)
 
 
 class StatusIndicator(Static):
@@ -355,11 +505,15 @@ class StatusIndicator(Static):
         "cancelled": ("\u25a0", "Cancelled", "yellow"),
     }
 
+    # Markup for each status, composed once
+    _RENDERED = {
+        status: f"[{style}]{icon} {text}[/]"
+        for status, (icon, text, style) in STATUS_CONFIG.items()
+    }
+    _UNKNOWN = "[white]\u003f Unknown[/]"
+
     def watch_status(self, status: str) -> None:
-        icon, text, style = self.STATUS_CONFIG.get(
-            status, ("\u003f", "Unknown", "white")
-        )
-        self.update(f"[{style}]{icon} {text}[/]")
+        self.update(self._RENDERED.get(status, self._UNKNOWN))
 
 
 class TranscriptionProgress(Static):
@@ -372,10 +526,7 @@ class TranscriptionProgress(Static):
     }
     """
 
-    segments = reactive(0)
-    total_chars = reactive(0)
-    speed = reactive(0.0)
-    current_text = reactive("")
+    _last_tuple: tuple | None = None
 
     def compose(self) -> ComposeResult:
         yield Static(id="progress-stats")
@@ -384,33 +535,37 @@ class TranscriptionProgress(Static):
     def update_progress(
         self, segments: int, total_chars: int, speed: float, preview: str
     ) -> None:
-        self.segments = segments
-        self.total_chars = total_chars
-        self.speed = speed
-        self.current_text = preview[:60] + "..." if len(preview) > 60 else preview
+        # Only what is actually displayed decides whether to re-render
+        preview = preview[:60] + "..." if len(preview) > 60 else preview
+        visible = (segments, total_chars, round(speed, 1), preview)
+        if visible == self._last_tuple:
+            return
+        self._last_tuple = visible
 
         try:
             stats = self.query_one("#progress-stats", Static)
+            preview_widget = self.query_one("#progress-preview", Static)
+        except NoMatches:
+            return
+        # Both lines change together; refresh the screen once for the pair
+        with self.app.batch_update():
             stats.update(
                 f"[bold]Segments:[/] [cyan]{segments}[/] | "
                 f"[bold]Characters:[/] [cyan]{total_chars:,}[/] | "
                 f"[bold]Speed:[/] [green]{speed:.1f}[/] chars/sec"
             )
-            preview_widget = self.query_one("#progress-preview", Static)
-            preview_widget.update(f'[dim italic]"{self.current_text}"[/]')
-        except NoMatches:
-            pass
+            preview_widget.update(f'[dim italic]"{preview}"[/]')
 
     def reset(self) -> None:
-        self.segments = 0
-        self.total_chars = 0
-        self.speed = 0.0
-        self.current_text = ""
+        self._last_tuple = None
         try:
-            self.query_one("#progress-stats", Static).update("")
-            self.query_one("#progress-preview", Static).update("")
+            stats = self.query_one("#progress-stats", Static)
+            preview_widget = self.query_one("#progress-preview", Static)
         except NoMatches:
-            pass
+            return
+        with self.app.batch_update():
+            stats.update("")
+            preview_widget.update("")
 
 
 class PathSelector(Static, can_focus=True):
@@ -460,14 +615,17 @@ class PathSelector(Static, can_focus=True):
         yield Static(f"[bold]{self.label_text}[/]", classes="path-label")
         yield Static(self.path, id=f"{self.selector_id}-value", classes="path-value")
 
+    _last_display: str | None = None
+
     def watch_path(self, path: str) -> None:
+        # Truncate long paths
+        display_path = path if len(path) <= 60 else "..." + path[-57:]
+        if display_path == self._last_display:
+            return
         try:
             value_widget = self.query_one(f"#{self.selector_id}-value", Static)
-            # Truncate long paths
-            display_path = path
-            if len(path) > 60:
-                display_path = "..." + path[-57:]
             value_widget.update(f"[cyan]{display_path}[/] [dim](enter to change)[/]")
+            self._last_display = display_path
         except NoMatches:
             pass
 
@@ -550,7 +708,7 @@ class DirectoryPickerScreen(ModalScreen):
         padding: 1 2;
     }
     
-    DirectoryPickerScreen DirectoryTree {
+    DirectoryPickerScreen DirectoryTree, DirectoryPickerScreen #dir-tree-placeholder {
         height: 1fr;
         background: $background;
         border: solid $primary-darken-2;
@@ -571,31 +729,47 @@ class DirectoryPickerScreen(ModalScreen):
         Binding("escape", "cancel", "Cancel"),
     ]
 
+    PATH_DEBOUNCE = 0.15  # Seconds of input idle time before the path is applied
+
     def __init__(self, selector_id: str, initial_path: Path):
         super().__init__()
         self.selector_id = selector_id
         self.initial_path = initial_path
         self.selected_path = initial_path
+        self._path_debounce_timer = None
 
     def compose(self) -> ComposeResult:
         with Container():
             yield Label(f"[bold]Select Directory[/]")
             yield Input(value=str(self.initial_path), id="path-input")
-            yield DirectoryTree(
-                str(
-                    self.initial_path.parent
-                    if self.initial_path.exists()
-                    else Path.home()
-                ),
-                id="dir-tree",
-            )
+            # The real tree is mounted by _load_tree once its root is resolved
+            yield Static("[dim]Loading...[/]", id="dir-tree-placeholder")
             with Horizontal(id="picker-buttons"):
                 yield Button("Select", variant="primary", id="select-btn")
                 yield Button("Cancel", variant="default", id="cancel-btn")
 
     def on_mount(self) -> None:
-        tree = self.query_one("#dir-tree", DirectoryTree)
+        self._load_tree()
+
+    @work(thread=True, exclusive=True)
+    def _load_tree(self) -> None:
+        """Resolve the tree root off the UI thread, then mount the tree."""
+        if os.path.isdir(self.initial_path):
+            root = self.initial_path.parent
+        else:
+            root = Path.home()
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._mount_tree, root)
+
+    def _mount_tree(self, root: Path) -> None:
+        try:
+            placeholder = self.query_one("#dir-tree-placeholder", Static)
+        except NoMatches:
+            return
+        tree = DirectoryTree(str(root), id="dir-tree")
         tree.show_guides = True
+        placeholder.parent.mount(tree, after=placeholder)
+        placeholder.remove()
 
     @on(DirectoryTree.DirectorySelected)
     def on_directory_selected(self, event: DirectoryTree.DirectorySelected) -> None:
@@ -604,10 +778,23 @@ class DirectoryPickerScreen(ModalScreen):
 
     @on(Input.Changed, "#path-input")
     def on_path_input_changed(self, event: Input.Changed) -> None:
-        self.selected_path = Path(event.value)
+        # Coalesce bursts of keystrokes or pastes into a single update
+        if self._path_debounce_timer is not None:
+            self._path_debounce_timer.stop()
+        self._path_debounce_timer = self.set_timer(
+            self.PATH_DEBOUNCE, self._apply_path_input
+        )
+
+    def _apply_path_input(self) -> None:
+        self._path_debounce_timer = None
+        self.selected_path = Path(self.query_one("#path-input", Input).value)
 
     @on(Button.Pressed, "#select-btn")
     def on_select(self) -> None:
+        # Don't lose an edit that is still waiting on the debounce timer
+        if self._path_debounce_timer is not None:
+            self._path_debounce_timer.stop()
+            self._apply_path_input()
         self.dismiss({"selector_id": self.selector_id, "path": self.selected_path})
 
     @on(Button.Pressed, "#cancel-btn")
@@ -721,26 +908,35 @@ class FilePickerScreen(ModalScreen):
         file_list = self.query_one("#file-list", VerticalScroll)
         file_list.remove_children()
 
-        audio_files = []
-        for ext in ["*.wav", "*.mp3", "*.m4a", "*.flac", "*.ogg"]:
-            audio_files.extend(recordings_dir.glob(ext))
-
-        audio_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+        # Stat each file once and reuse the result for selection and display;
+        # only the 50 newest are shown, so a bounded heap beats a full sort
+        newest = heapq.nlargest(
+            50,
+            ((entry.path, entry.stat()) for entry in _list_audio(recordings_dir)),
+            key=lambda entry: entry[1].st_mtime,
+        )
 
-        if not audio_files:
+        if not newest:
             file_list.mount(Static("[dim]No audio files found[/]"))
             return
 
-        for i, f in enumerate(audio_files[:50]):  # Limit to 50 files
-            size_kb = f.stat().st_size // 1024
-            mtime = datetime.fromtimestamp(f.stat().st_mtime).strftime("%Y-%m-%d %H:%M")
+        items = []
+        for i, (path, st) in enumerate(newest):
+            f = Path(path)
+            size_kb = st.st_size // 1024
+            mtime = datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d %H:%M")
             display_text = f"[bold]{f.name}[/] [dim]({size_kb} KB, {mtime})[/]"
-            item = FileItem(
-                f,
-                display_text,
-                id=f"file-{i}",
+            items.append(
+                FileItem(
+                    f,
+                    display_text,
+                    id=f"file-{i}",
+                )
             )
-            file_list.mount(item)
+
+        # Mount everything at once so layout is recomputed a single time
+        with self.app.batch_update():
+            file_list.mount(*items)
 
     @on(FileItem.Selected)
     def on_file_selected(self, event: FileItem.Selected) -> None:
@@ -929,16 +1125,31 @@ class RecordTranscribeTUI(App):
             os.environ.get("TRANSCRIPTS_DIR", self.settings.transcripts_dir)
         )
         self.max_seconds = int(os.environ.get("MAX_SECONDS", self.settings.max_seconds))
+        # Opt-in: transcribe in a background worker that outlives the TUI and
+        # keeps the model loaded; it exits after OFFLINESTT_WORKER_IDLE seconds
+        # (default 600) idle, or on `python worker.py --stop`
+        self.use_worker = os.environ.get("OFFLINESTT_WORKER") == "1"
+        self.prefer_distil = (
+            os.environ.get("PREFER_DISTIL", "1" if self.settings.prefer_distil else "")
+            == "1"
+        )
 
-        self.recording_process: subprocess.Popen | None = None
+        self.recording_process: asyncio.subprocess.Process | None = None
+        self._record_waiter: asyncio.Task | None = None
+        self._ts_cache: tuple[int, str] = (0, "")
         self.current_recording: Path | None = None
         self.selected_audio_file: Path | None = None
         self.transcribe_task: asyncio.Task | None = None
         self._model = None
-        self._model_size = None
+        self._pipeline = None
+        self._model_key: tuple[str, str, str] | None = None
+        self._prewarm_task: asyncio.Task | None = None
+        self._deps_task: asyncio.Task | None = None
+        self._pending_progress: tuple[int, int, float, str] | None = None
 
     def compose(self) -> ComposeResult:
         yield Header()
+        yield AnimationClock(id="animation-clock")
         with Container(id="status-section"):
             with Horizontal(id="status-row"):
                 yield StatusIndicator(id="status-indicator")
@@ -950,7 +1161,13 @@ class RecordTranscribeTUI(App):
             with Horizontal(id="settings"):
                 yield Label("Model:")
                 yield Select(
-                    [(s, s) for s in ["tiny", "small", "medium", "large-v3"]],
+                    [
+                        ("tiny", "tiny"),
+                        ("small", "small"),
+                        ("medium", "medium"),
+                        ("large-v3 (accurate)", "large-v3"),
+                        ("large-v3 (distil, 2\u00d7)", "distil-large-v3"),
+                    ],
                     value=os.environ.get("MODEL_SIZE", self.settings.model_size),
                     id="model-select",
                 )
@@ -966,6 +1183,30 @@ class RecordTranscribeTUI(App):
                     value=os.environ.get("DEVICE", self.settings.device),
                     id="device-select",
                 )
+                yield Label("Compute:")
+                yield Select(
+                    [
+                        ("Auto", "auto"),
+                        ("int8", "int8"),
+                        ("int8_float16", "int8_float16"),
+                        ("float16", "float16"),
+                        ("float32", "float32"),
+                    ],
+                    value=os.environ.get("COMPUTE_TYPE", self.settings.compute_type),
+                    id="compute-select",
+                )
+                yield Label("Quality:")
+                yield Select(
+                    QUALITY_OPTIONS,
+                    value=_initial_beam_size(self.settings.beam_size),
+                    id="quality-select",
+                )
+                yield Label("VAD:")
+                yield Switch(
+                    value=os.environ.get("MODEL_SIZE", self.settings.model_size)
+                    not in VAD_DEFAULT_OFF,
+                    id="vad-toggle",
+                )
             with Horizontal(id="buttons"):
                 yield Button("Record", id="record-btn", variant="primary")
                 yield Button("Transcribe", id="transcribe-btn", variant="success")
@@ -991,6 +1232,20 @@ class RecordTranscribeTUI(App):
         yield Footer()
 
     def on_mount(self) -> None:
+        # Widgets touched on every state change; look them up only once
+        self._status_indicator = self.query_one("#status-indicator", StatusIndicator)
+        self._timer_widget = self.query_one("#timer", Timer)
+        self._waveform = self.query_one("#waveform", WaveformWidget)
+        self._spinner = self.query_one("#spinner", SpinnerWidget)
+        self._progress = self.query_one(
+            "#transcription-progress", TranscriptionProgress
+        )
+        self._record_btn = self.query_one("#record-btn", Button)
+        # Segment progress is pushed to the screen at most 10 times a second
+        self._progress_timer = self.set_interval(0.1, self._flush_progress, pause=True)
+        self._file_selector = self.query_one("#file-selector", FileSelector)
+        self._log = self.query_one("#log", RichLog)
+
         self.recordings_dir.mkdir(parents=True, exist_ok=True)
         self.transcripts_dir.mkdir(parents=True, exist_ok=True)
 
@@ -1005,9 +1260,21 @@ class RecordTranscribeTUI(App):
         )
         self.log_message(f"Max recording duration: {self.max_seconds}s")
 
+        # Importing faster_whisper loads ctranslate2, tokenizers and PyAV;
+        # do it off the UI thread now rather than on the first transcription
+        self._deps_task = asyncio.create_task(asyncio.to_thread(_import_faster_whisper))
+
+        # Opt-in, as in transcribe.py: load the selected model up front
+        if os.environ.get("OFFLINESTT_PREWARM") == "1" and not self.use_worker:
+            self._prewarm_task = asyncio.create_task(self._prewarm_model())
+
     def log_message(self, message: str, style: str = "") -> None:
-        log = self.query_one("#log", RichLog)
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        log = self._log
+        # Bursts of log lines share a second; format each second only once
+        sec = int(time.time())
+        if sec != self._ts_cache[0]:
+            self._ts_cache = (sec, time.strftime("%H:%M:%S", time.localtime(sec)))
+        timestamp = self._ts_cache[1]
         if style:
             log.write(f"[{style}][{timestamp}] {message}[/]")
         else:
@@ -1021,11 +1288,11 @@ class RecordTranscribeTUI(App):
     def is_transcribing(self) -> bool:
         return self.transcribe_task is not None and not self.transcribe_task.done()
 
-    def action_toggle_recording(self) -> None:
+    async def action_toggle_recording(self) -> None:
         if self.is_recording:
-            self.stop_recording()
+            await self.stop_recording()
         else:
-            self.start_recording()
+            await self.start_recording()
 
     def action_transcribe(self) -> None:
         if self.is_recording:
@@ -1040,9 +1307,7 @@ class RecordTranscribeTUI(App):
 
         if not audio_file:
             # Find latest audio file
-            audio_files = []
-            for ext in ["*.wav", "*.mp3", "*.m4a", "*.flac", "*.ogg"]:
-                audio_files.extend(self.recordings_dir.glob(ext))
+            audio_files = _list_audio(self.recordings_dir)
 
             if not audio_files:
                 self.log_message(
@@ -1050,7 +1315,8 @@ class RecordTranscribeTUI(App):
                 )
                 return
 
-            audio_file = max(audio_files, key=lambda p: p.stat().st_mtime)
+            latest = max(audio_files, key=lambda entry: entry.stat().st_mtime)
+            audio_file = Path(latest.path)
 
         self.start_transcription(audio_file)
 
@@ -1060,10 +1326,10 @@ class RecordTranscribeTUI(App):
     def on_file_picked(self, result: Path | None) -> None:
         if result:
             self.selected_audio_file = result
-            self.query_one("#file-selector", FileSelector).file_path = str(result)
+            self._file_selector.file_path = str(result)
             self.log_message(f"Selected file: {result.name}", "green")
 
-    def start_recording(self) -> None:
+    async def start_recording(self) -> None:
         if self.is_recording:
             return
 
@@ -1078,77 +1344,74 @@ class RecordTranscribeTUI(App):
         self.selected_audio_file = None  # Clear any previous selection
 
         try:
-            self.recording_process = subprocess.Popen(
-                [
-                    "timeout",
-                    "--foreground",
-                    str(self.max_seconds),
-                    "rec",
-                    "-r",
-                    "16000",
-                    "-c",
-                    "1",
-                    "-b",
-                    "16",
-                    str(self.current_recording),
-                ],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                preexec_fn=os.setsid,
+            self.recording_process = await asyncio.create_subprocess_exec(
+                "timeout",
+                "--foreground",
+                str(self.max_seconds),
+                "rec",
+                "-r",
+                "16000",
+                "-c",
+                "1",
+                "-b",
+                "16",
+                str(self.current_recording),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+                # A new process group without preexec_fn keeps posix_spawn usable
+                process_group=0,
             )
         except FileNotFoundError:
             self.log_message("Error: 'rec' (sox) not found. Please install sox.", "red")
-            self.query_one("#status-indicator", StatusIndicator).status = "error"
+            self._status_indicator.status = "error"
             return
 
         self.log_message(f"Recording to: {self.current_recording.name}", "bold red")
-        self.query_one("#status-indicator", StatusIndicator).status = "recording"
-        self.query_one("#timer", Timer).start()
-        self.query_one("#waveform", WaveformWidget).start()
+        self._status_indicator.status = "recording"
+        self._timer_widget.start()
+        self._waveform.start()
 
-        record_btn = self.query_one("#record-btn", Button)
+        record_btn = self._record_btn
         record_btn.label = "Stop"
         record_btn.add_class("recording")
 
         # Update file selector
-        self.query_one("#file-selector", FileSelector).file_path = str(
-            self.current_recording
-        )
+        self._file_selector.file_path = str(self.current_recording)
 
-        # Monitor recording process
-        self.set_timer(1, self.check_recording_status)
-
-    def check_recording_status(self) -> None:
-        if self.recording_process is None:
-            return
+        # Finish as soon as the recorder exits instead of polling it
+        self._record_waiter = asyncio.create_task(self._await_recording())
 
-        ret = self.recording_process.poll()
-        if ret is not None:
-            self.finish_recording()
-        else:
-            self.set_timer(1, self.check_recording_status)
+    async def _await_recording(self) -> None:
+        await self.recording_process.wait()
+        self.finish_recording()
 
-    def stop_recording(self) -> None:
+    async def stop_recording(self) -> None:
         if self.recording_process is None:
             return
 
+        process = self.recording_process
         try:
-            os.killpg(os.getpgid(self.recording_process.pid), signal.SIGTERM)
-            self.recording_process.wait(timeout=5)
-        except (ProcessLookupError, subprocess.TimeoutExpired):
+            # timeout forwards SIGTERM to rec, which then finalizes the file
+            process.send_signal(signal.SIGTERM)
+            await asyncio.wait_for(process.wait(), timeout=5)
+        except ProcessLookupError:
+            pass
+        except asyncio.TimeoutError:
+            # The recorder runs in its own process group (pgid == pid)
             try:
-                os.killpg(os.getpgid(self.recording_process.pid), signal.SIGKILL)
+                os.killpg(process.pid, signal.SIGKILL)
             except ProcessLookupError:
                 pass
 
-        self.finish_recording()
+        # The waiter finalizes the recording once the process is reaped
+        await self._record_waiter
 
     def finish_recording(self) -> None:
         self.recording_process = None
-        self.query_one("#timer", Timer).stop()
-        self.query_one("#waveform", WaveformWidget).stop()
+        self._timer_widget.stop()
+        self._waveform.stop()
 
-        record_btn = self.query_one("#record-btn", Button)
+        record_btn = self._record_btn
         record_btn.label = "Record"
         record_btn.remove_class("recording")
 
@@ -1158,15 +1421,13 @@ class RecordTranscribeTUI(App):
                 f"Recording saved: {self.current_recording.name} ({size // 1024} KB)",
                 "green",
             )
-            self.query_one("#status-indicator", StatusIndicator).status = "idle"
-            self.query_one("#file-selector", FileSelector).file_path = str(
-                self.current_recording
-            )
+            self._status_indicator.status = "idle"
+            self._file_selector.file_path = str(self.current_recording)
             # Auto-start transcription
             self.start_transcription(self.current_recording)
         else:
             self.log_message("Recording failed or was cancelled", "red")
-            self.query_one("#status-indicator", StatusIndicator).status = "error"
+            self._status_indicator.status = "error"
 
     def _unload_model(self) -> None:
         """Unload the Whisper model to free memory."""
@@ -1175,175 +1436,350 @@ class RecordTranscribeTUI(App):
             # Clear model reference
             model = self._model
             self._model = None
-            self._model_size = None
+            self._pipeline = None
+            self._model_key = None
             del model
-            # Force garbage collection multiple times to ensure cleanup
-            gc.collect()
+            # A single collection is enough; the model holds no reference cycles
             gc.collect()
             self.log_message("Model unloaded", "dim")
 
     def start_transcription(self, audio_file: Path) -> None:
         self.log_message(f"Starting transcription: {audio_file.name}", "cyan")
-        self.query_one("#spinner", SpinnerWidget).start()
+        self._spinner.start()
 
-        model_size = str(self.query_one("#model-select", Select).value)
         language = str(self.query_one("#language-select", Select).value)
+        model_size = self._selected_model_size(language)
         device = str(self.query_one("#device-select", Select).value)
+        if model_size == "large-v3" and self.prefer_distil:
+            self.log_message(
+                f"Keeping large-v3: distil-large-v3 is English-only, not {language}",
+                "dim",
+            )
+        elif model_size.startswith("distil-") and language != "en":
+            self.log_message(
+                f"{model_size} is trained for English; pick large-v3 for {language}",
+                "yellow",
+            )
+        compute_type = self._selected_compute_type()
+        beam_size = int(self.query_one("#quality-select", Select).value)
+        vad_filter = self.query_one("#vad-toggle", Switch).value
 
         self.transcribe_task = asyncio.create_task(
-            self.run_transcription(audio_file, model_size, language, device)
+            self.run_transcription(
+                audio_file,
+                model_size,
+                language,
+                device,
+                compute_type,
+                beam_size,
+                vad_filter,
+            )
         )
 
+    def _flush_progress(self) -> None:
+        if self._pending_progress is not None:
+            self._progress.update_progress(*self._pending_progress)
+            self._pending_progress = None
+
+    def _selected_model_size(self, language: str) -> str:
+        model_size = str(self.query_one("#model-select", Select).value)
+        # Same accuracy class as large-v3 at roughly twice the speed, but the
+        # distilled model only transcribes English
+        if model_size == "large-v3" and self.prefer_distil and language == "en":
+            return "distil-large-v3"
+        return model_size
+
+    def _selected_compute_type(self) -> str:
+        # "auto" is resolved against the device where the model is loaded
+        return str(self.query_one("#compute-select", Select).value)
+
     async def run_transcription(
-        self, audio_file: Path, model_size: str, language: str, device: str
+        self,
+        audio_file: Path,
+        model_size: str,
+        language: str,
+        device: str,
+        compute_type: str,
+        beam_size: int,
+        vad_filter: bool,
     ) -> None:
         """Run transcription using the transcribe module directly."""
-        from faster_whisper import WhisperModel
-
-        start_time = time.time()
-        status_indicator = self.query_one("#status-indicator", StatusIndicator)
-        progress_widget = self.query_one(
-            "#transcription-progress", TranscriptionProgress
-        )
-        spinner = self.query_one("#spinner", SpinnerWidget)
+        start_time = time.monotonic()
+        status_indicator = self._status_indicator
+        progress_widget = self._progress
+        spinner = self._spinner
+
+        lang_param = None if language == "auto" else language
+        options = {"language": lang_param}
+        if vad_filter:
+            # Silero VAD drops silent stretches before the encoder runs
+            options.update(
+                vad_filter=True,
+                vad_parameters={"min_silence_duration_ms": 500, "threshold": 0.5},
+            )
+        batch_size = worker.auto_batch_size(device)
+        # The batched pipeline builds its windows from VAD speech chunks
+        if batch_size > 1 and vad_filter:
+            # Decode several windows per forward pass
+            options["batch_size"] = batch_size
+        if beam_size == 0:
+            # Batched GPU decoding runs a 5-wide beam about as fast as greedy;
+            # elsewhere each extra beam costs decoder time for no WER gain
+            beam_size = 5 if device == "cuda" and "batch_size" in options else 1
+        options["beam_size"] = beam_size
+
+        model_task = None
+        conn = None
+        if self.use_worker:
+            self.log_message(f"Sending to transcription worker: {model_size}...")
+        else:
+            # Load the model in the background while the audio is decoded
+            self.log_message(f"Loading Whisper model: {model_size}...")
+            model_task = asyncio.create_task(
+                self._load_model(model_size, device, compute_type)
+            )
 
         try:
-            # Convert audio if needed
-            status_indicator.status = "converting"
-            self.log_message("Converting audio to compatible format...")
-
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_wav = Path(temp_dir) / "converted.wav"
-
-                # Run ffmpeg conversion in a thread
-                process = await asyncio.create_subprocess_exec(
-                    "ffmpeg",
-                    "-i",
-                    str(audio_file),
-                    "-ar",
-                    "16000",
-                    "-ac",
-                    "1",
-                    "-c:a",
-                    "pcm_s16le",
-                    str(temp_wav),
-                    "-y",
-                    "-hide_banner",
-                    "-loglevel",
-                    "error",
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
+            if self.use_worker:
+                # The worker decodes the file and may already hold the model
+                status_indicator.status = "loading_model"
+                conn = await self._worker_connection()
+                conn.send(
+                    {
+                        "audio_path": str(audio_file),
+                        "model_size": model_size,
+                        "device": device,
+                        "compute_type": compute_type,
+                        "model_options": {
+                            "cpu_threads": worker.physical_cores(),
+                            "num_workers": 1,
+                        },
+                        "options": options,
+                    }
                 )
-                await process.wait()
-
-                if process.returncode != 0:
-                    self.log_message("Audio conversion failed", "red")
+                _, loaded_compute_type = await asyncio.to_thread(worker.recv, conn)
+            else:
+                # Decode in-process with PyAV to 16 kHz mono float32; no temp WAV
+                status_indicator.status = "converting"
+                self.log_message("Decoding audio...")
+                faster_whisper = await self._faster_whisper()
+
+                try:
+                    audio = await asyncio.to_thread(
+                        faster_whisper.decode_audio, str(audio_file)
+                    )
+                except Exception as e:
+                    self.log_message(f"Audio conversion failed: {e}", "red")
                     status_indicator.status = "error"
                     spinner.stop()
                     return
 
                 self.log_message("Audio converted successfully", "green")
 
-                # Load model
-                status_indicator.status = "loading_model"
-                self.log_message(f"Loading Whisper model: {model_size}...")
+                # Wait for the model if it is still loading
+                if not model_task.done():
+                    status_indicator.status = "loading_model"
+                await model_task
+                loaded_compute_type = self._model.model.compute_type
 
-                # Check if we need to reload the model
-                if self._model is None or self._model_size != model_size:
-                    # Run model loading in a thread to not block UI
-                    self._model = await asyncio.to_thread(
-                        WhisperModel, model_size, device=device, compute_type="int8"
-                    )
-                    self._model_size = model_size
-
-                self.log_message(f"Model loaded ({device})", "green")
+            self.log_message(f"Model loaded ({device}, {loaded_compute_type})", "green")
 
-                # Start transcription
-                status_indicator.status = "transcribing"
-                self.log_message("Transcribing audio...")
+            # Start transcription
+            status_indicator.status = "transcribing"
+            self.log_message("Transcribing audio...")
 
-                # Run transcription in a thread
-                lang_param = None if language == "auto" else language
+            # Run transcription in a thread
+            if self.use_worker:
+                _, info = await asyncio.to_thread(worker.recv, conn)
+                next_segment = functools.partial(_next_worker_segment, conn)
+            else:
+                if "batch_size" in options:
+                    transcribe = self._pipeline.transcribe
+                else:
+                    transcribe = self._model.transcribe
                 segments_gen, info = await asyncio.to_thread(
-                    self._model.transcribe,
-                    str(temp_wav),
-                    beam_size=5,
-                    language=lang_param,
+                    transcribe, audio, **options
                 )
+                next_segment = functools.partial(next, segments_gen, _END_OF_SEGMENTS)
 
+            self.log_message(
+                f"Detected language: {info.language} (confidence: {info.language_probability:.2f})",
+                "cyan",
+            )
+            if vad_filter:
                 self.log_message(
-                    f"Detected language: {info.language} (confidence: {info.language_probability:.2f})",
-                    "cyan",
+                    f"VAD skipped {info.duration - info.duration_after_vad:.1f}s "
+                    f"of {info.duration:.1f}s as silence",
+                    "dim",
                 )
 
-                # Process segments
-                timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
-                output_path = self.transcripts_dir / f"{timestamp}.md"
-
-                segment_count = 0
-                total_chars = 0
-                all_text = []
-
-                # Open output file
-                with open(output_path, "w") as md_file:
-                    md_file.write("# Transcription Results\n\n")
-                    md_file.write(f"**Audio File:** {audio_file.name}\n\n")
-                    md_file.write(f"**Model:** {model_size}\n\n")
-                    md_file.write(f"**Language:** {info.language}\n\n")
-                    md_file.write("---\n\n")
-
-                    # Process segments in batches to update UI
-                    segments_list = await asyncio.to_thread(list, segments_gen)
-
-                    for segment in segments_list:
-                        segment_count += 1
-                        text = segment.text.strip()
-                        total_chars += len(text)
-                        all_text.append(text)
-
-                        elapsed = time.time() - start_time
-                        speed = total_chars / elapsed if elapsed > 0 else 0
-
-                        # Update progress
-                        progress_widget.update_progress(
-                            segment_count, total_chars, speed, text
-                        )
-
-                        # Write to file
-                        md_file.write(f"{text}\n")
-                        if segment_count % 5 == 0:
-                            md_file.write("\n")
-
-                        # Allow UI to update
-                        await asyncio.sleep(0)
-
-                # Final stats
-                elapsed = time.time() - start_time
-                self.log_message(
-                    f"Transcription complete: {segment_count} segments, "
-                    f"{total_chars:,} chars in {elapsed:.1f}s",
-                    "bold green",
+            # Process segments
+            timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
+            output_path = self.transcripts_dir / f"{timestamp}.md"
+
+            segment_count = 0
+            total_chars = 0
+
+            # Collect output in memory and write it out in a few large chunks
+            fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            buf = io.BytesIO()
+            try:
+                buf.write(
+                    (
+                        "# Transcription Results\n\n"
+                        f"**Audio File:** {audio_file.name}\n\n"
+                        f"**Model:** {model_size}\n\n"
+                        f"**Language:** {info.language}\n\n"
+                        "---\n\n"
+                    ).encode()
                 )
-                self.log_message(f"Output saved to: {output_path.name}", "green")
 
-                status_indicator.status = "done"
-                spinner.stop()
+                # Pull segments one at a time as the model decodes them, so
+                # the first lines show up without waiting for the whole file
+                self._progress_timer.resume()
+                while True:
+                    segment = await asyncio.to_thread(next_segment)
+                    if segment is _END_OF_SEGMENTS:
+                        break
+                    segment_count += 1
+                    text = segment.text.strip()
+                    total_chars += len(text)
+
+                    # Picked up by _flush_progress on the next 100 ms tick
+                    elapsed = time.monotonic() - start_time
+                    speed = total_chars / elapsed if elapsed > 0 else 0
+                    self._pending_progress = (segment_count, total_chars, speed, text)
+
+                    # Write to file
+                    buf.write(f"{text}\n".encode())
+                    if segment_count % 5 == 0:
+                        buf.write(b"\n")
+                    if segment_count % WRITE_BATCH_SEGMENTS == 0:
+                        _write_all(fd, buf.getvalue())
+                        buf.seek(0)
+                        buf.truncate()
+            finally:
+                # Keep whatever was transcribed, even on cancel or error
+                _write_all(fd, buf.getvalue())
+                os.close(fd)
+
+            # Final stats
+            elapsed = time.monotonic() - start_time
+            self._flush_progress()
+            self.log_message(
+                f"Transcription complete: {segment_count} segments, "
+                f"{total_chars:,} chars in {elapsed:.1f}s",
+                "bold green",
+            )
+            self.log_message(f"Output saved to: {output_path.name}", "green")
 
-                # Unload model to free memory
-                self._unload_model()
+            status_indicator.status = "done"
+            spinner.stop()
 
         except asyncio.CancelledError:
             self.log_message("Transcription cancelled", "yellow")
             status_indicator.status = "cancelled"
             spinner.stop()
             progress_widget.reset()
-            self._unload_model()
         except Exception as e:
             self.log_message(f"Transcription error: {e}", "red")
             status_indicator.status = "error"
             spinner.stop()
             progress_widget.reset()
             self._unload_model()
+        finally:
+            if model_task is not None:
+                model_task.cancel()
+            if conn is not None:
+                worker.hang_up(conn)
+            self._progress_timer.pause()
+            self._pending_progress = None
+
+    async def _worker_connection(self):
+        """Connect to the transcription worker, starting it if needed."""
+        try:
+            return worker.connect()
+        except OSError:
+            pass
+        # A session of its own keeps the worker (and its model) alive after
+        # the TUI exits; the next TUI reconnects to the same socket
+        self.log_message("Starting transcription worker...", "dim")
+        subprocess.Popen(
+            [sys.executable, worker.__file__],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        for _ in range(100):
+            await asyncio.sleep(0.1)
+            try:
+                return worker.connect()
+            except OSError:
+                pass
+        raise RuntimeError("transcription worker did not start")
+
+    async def _faster_whisper(self):
+        """Return the faster_whisper module preloaded in on_mount."""
+        module = await self._deps_task if self._deps_task else None
+        if module is None:
+            # Not preloaded (or missing): import here so the error surfaces
+            import faster_whisper as module
+        return module
+
+    async def _load_model(
+        self, model_size: str, device: str, compute_type: str
+    ) -> None:
+        """Load the Whisper model in a thread unless the cached one matches."""
+        faster_whisper = await self._faster_whisper()
+
+        # Let a running prewarm finish rather than loading a second copy
+        prewarm = self._prewarm_task
+        if prewarm is not None and prewarm is not asyncio.current_task():
+            await asyncio.wait([prewarm])
+
+        key = (model_size, device, compute_type)
+        if self._model is not None and self._model_key == key:
+            return
+
+        # Release the previous model first so two are never resident at once
+        self._model = None
+        self._pipeline = None
+        self._model_key = None
+        # Run model loading in a thread to not block UI
+        compute_type = await asyncio.to_thread(
+            worker.resolve_compute_type, device, compute_type
+        )
+        self._model = await asyncio.to_thread(
+            worker.open_whisper_model,
+            faster_whisper.WhisperModel,
+            model_size,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=worker.physical_cores(),
+            num_workers=1,
+        )
+        # The pipeline only wraps the model, so it is cached alongside it
+        self._pipeline = faster_whisper.BatchedInferencePipeline(model=self._model)
+        self._model_key = key
+
+    async def _prewarm_model(self) -> None:
+        """Load the selected model and run a tiny decode ahead of the first run."""
+        import numpy as np
+
+        language = str(self.query_one("#language-select", Select).value)
+        model_size = self._selected_model_size(language)
+        device = str(self.query_one("#device-select", Select).value)
+        try:
+            await self._load_model(model_size, device, self._selected_compute_type())
+            # One second of silence is enough to initialize the decoder
+            segments, _ = await asyncio.to_thread(
+                self._model.transcribe, np.zeros(16000, dtype=np.float32)
+            )
+            await asyncio.to_thread(list, segments)
+            self.log_message(f"Model {model_size} ready", "dim")
+        except Exception as e:
+            self.log_message(f"Model prewarm failed: {e}", "yellow")
 
     def on_directory_picker_screen_dismiss(self, result) -> None:
         if result:
@@ -1364,6 +1800,9 @@ class RecordTranscribeTUI(App):
     @on(Select.Changed, "#model-select")
     def on_model_changed(self, event: Select.Changed) -> None:
         self.settings.update(model_size=str(event.value))
+        self.query_one("#vad-toggle", Switch).value = (
+            str(event.value) not in VAD_DEFAULT_OFF
+        )
 
     @on(Select.Changed, "#language-select")
     def on_language_changed(self, event: Select.Changed) -> None:
@@ -1373,14 +1812,22 @@ class RecordTranscribeTUI(App):
     def on_device_changed(self, event: Select.Changed) -> None:
         self.settings.update(device=str(event.value))
 
+    @on(Select.Changed, "#compute-select")
+    def on_compute_changed(self, event: Select.Changed) -> None:
+        self.settings.update(compute_type=str(event.value))
+
+    @on(Select.Changed, "#quality-select")
+    def on_quality_changed(self, event: Select.Changed) -> None:
+        self.settings.update(beam_size=int(event.value))
+
     def watch_theme(self, theme: str) -> None:
         """Save theme when it changes."""
         if hasattr(self, "settings"):
             self.settings.update(theme=theme)
 
     @on(Button.Pressed, "#record-btn")
-    def handle_record_button(self) -> None:
-        self.action_toggle_recording()
+    async def handle_record_button(self) -> None:
+        await self.action_toggle_recording()
 
     @on(Button.Pressed, "#transcribe-btn")
     def handle_transcribe_button(self) -> None:
@@ -1391,11 +1838,11 @@ class RecordTranscribeTUI(App):
         self.action_pick_file()
 
     def action_clear_log(self) -> None:
-        self.query_one("#log", RichLog).clear()
+        self._log.clear()
 
-    def action_request_quit(self) -> None:
+    async def action_request_quit(self) -> None:
         if self.is_recording:
-            self.stop_recording()
+            await self.stop_recording()
         if self.transcribe_task and not self.transcribe_task.done():
             self.transcribe_task.cancel()
         self.exit()
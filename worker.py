@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Background transcription worker that keeps a Whisper model loaded.
+
+The worker listens on a UNIX socket and outlives the TUI that started it, so
+restarting the TUI skips the model load. Each connection carries one request
+and gets back ("model", compute_type), ("info", info), a ("segment", segment)
+per decoded segment and finally ("done", None), or ("error", message).
+
+The worker exits after OFFLINESTT_WORKER_IDLE seconds (default 600) without
+a request, releasing the model; ``python worker.py --stop`` stops it now.
+"""
+
+import fcntl
+import os
+import socket
+import sys
+import threading
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "offlinestt"
+)
+MODEL_CACHE_DIR = CACHE_DIR / "models"
+SOCKET_PATH = CACHE_DIR / "worker.sock"
+LOCK_PATH = CACHE_DIR / "worker.lock"
+IDLE_TIMEOUT = float(os.environ.get("OFFLINESTT_WORKER_IDLE", 600))
+
+# Preferred CUDA compute types, fastest first
+CUDA_COMPUTE_TYPES = ("int8_float16", "float16", "int8")
+
+
+def physical_cores() -> int:
+    """Physical core count; hyperthread siblings only add contention."""
+    import psutil
+
+    return psutil.cpu_count(logical=False) or os.cpu_count() or 1
+
+
+def auto_batch_size(device: str) -> int:
+    """Return how many 30 s windows to decode per forward pass."""
+    if device == "cuda":
+        return 8
+    # Batching only pays off with enough real cores to run the windows on
+    if physical_cores() >= 8:
+        return 4
+    return 1
+
+
+def resolve_compute_type(device: str, compute_type: str) -> str:
+    """Resolve "auto" to the fastest type the device supports.
+
+    On CPU, "auto" is left to CTranslate2 to pick.
+    """
+    if compute_type != "auto" or device != "cuda":
+        return compute_type
+    import ctranslate2
+
+    # Half precision needs tensor cores; older GPUs fall back to int8
+    supported = ctranslate2.get_supported_compute_types("cuda")
+    for cuda_type in CUDA_COMPUTE_TYPES:
+        if cuda_type in supported:
+            return cuda_type
+    return "auto"
+
+
+def open_whisper_model(whisper_model, model_size: str, **kwargs):
+    """Load a model from the local cache, only going online on a cache miss."""
+    try:
+        return whisper_model(
+            model_size,
+            download_root=str(MODEL_CACHE_DIR),
+            local_files_only=True,
+            **kwargs,
+        )
+    except OSError:
+        # Not cached yet (huggingface_hub's LocalEntryNotFoundError)
+        return whisper_model(
+            model_size,
+            download_root=str(MODEL_CACHE_DIR),
+            local_files_only=False,
+            **kwargs,
+        )
+
+
+def connect(socket_path: Path = SOCKET_PATH):
+    """Connect to a running worker; raises OSError if none is listening."""
+    return Client(str(socket_path), family="AF_UNIX")
+
+
+def stop(socket_path: Path = SOCKET_PATH) -> bool:
+    """Ask a running worker to exit; returns False if none is listening."""
+    try:
+        conn = connect(socket_path)
+    except OSError:
+        return False
+    with conn:
+        conn.send({"cmd": "stop"})
+    return True
+
+
+def hang_up(conn) -> None:
+    """Close conn, first waking any thread blocked in conn.recv() with EOF."""
+    # Closing the fd alone neither interrupts a read in progress nor tells the
+    # worker, which would keep decoding; shutdown() does both
+    try:
+        with socket.socket(fileno=os.dup(conn.fileno())) as sock:
+            sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    conn.close()
+
+
+def recv(conn) -> tuple:
+    """Receive the next (kind, payload) message, raising worker errors."""
+    kind, payload = conn.recv()
+    if kind == "error":
+        raise RuntimeError(payload)
+    return kind, payload
+
+
+def _handle(conn, request: dict, state: dict) -> None:
+    """Transcribe one request, streaming the results back over conn."""
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
+
+    key = (request["model_size"], request["device"], request["compute_type"])
+    if state.get("key") != key:
+        # Release the previous model first so two are never resident at once
+        state.clear()
+        state["model"] = open_whisper_model(
+            WhisperModel,
+            request["model_size"],
+            device=request["device"],
+            compute_type=resolve_compute_type(
+                request["device"], request["compute_type"]
+            ),
+            **request["model_options"],
+        )
+        state["pipeline"] = BatchedInferencePipeline(model=state["model"])
+        state["key"] = key
+    conn.send(("model", state["model"].model.compute_type))
+
+    options = request["options"]
+    transcriber = state["pipeline"] if "batch_size" in options else state["model"]
+    segments, info = transcriber.transcribe(request["audio_path"], **options)
+    conn.send(("info", info))
+    for segment in segments:
+        conn.send(("segment", segment))
+    conn.send(("done", None))
+
+
+def serve(
+    socket_path: Path = SOCKET_PATH,
+    idle_timeout: float = IDLE_TIMEOUT,
+    lock_path: Path = LOCK_PATH,
+) -> None:
+    """Serve requests one connection at a time until stopped or idle."""
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    # Held for the worker's lifetime, so two workers started at once cannot
+    # both unlink and rebind the socket
+    with open(lock_path, "w") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return  # Another worker is already serving
+        _serve_locked(socket_path, idle_timeout)
+
+
+def _serve_locked(socket_path: Path, idle_timeout: float) -> None:
+    # Nobody is serving; clear a socket left behind by a dead worker
+    socket_path.unlink(missing_ok=True)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    # Requests are unpickled, so only this user may connect to the socket
+    umask = os.umask(0o177)
+    try:
+        listener = Listener(str(socket_path), family="AF_UNIX")
+    finally:
+        os.umask(umask)
+
+    state = {}
+    with listener:
+        while True:
+            # accept() cannot time out, so an idle worker sends itself a stop
+            idle = threading.Timer(idle_timeout, stop, (socket_path,))
+            idle.daemon = True
+            idle.start()
+            conn = listener.accept()
+            idle.cancel()
+            with conn:
+                try:
+                    request = conn.recv()
+                    if request.get("cmd") == "stop":
+                        return
+                    _handle(conn, request, state)
+                except (EOFError, BrokenPipeError, ConnectionResetError):
+                    # The client went away, e.g. the transcription was cancelled
+                    pass
+                except Exception as e:
+                    try:
+                        conn.send(("error", str(e)))
+                    except OSError:
+                        pass
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--stop"]:
+        if not stop():
+            print("No transcription worker is running")
+    else:
+        serve()